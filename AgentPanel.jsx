@@ -3,10 +3,18 @@ import { getDominantPractice, getFreeTime, PRACTICE_COLORS, PRACTICE_LABELS, INS
 import './AgentPanel.css';
 
 export default function AgentPanel({ agent, model, onClose }) {
-  const { institutions, adjacency } = model;
+  const { institutions, adjacencyCSR } = model;
   const dom     = getDominantPractice(agent, institutions);
   const color   = PRACTICE_COLORS[dom] || '#999';
-  const nbrs    = [...(adjacency.get(agent.id) || [])];
+  // Neighbour ids straight from the CSR row — a zero-copy view whose
+  // length is the degree, instead of materialising the adjacency set on
+  // every render. An id outside the model (stale selection) must degrade
+  // to no connections: indptr[id] would be undefined, and
+  // subarray(undefined, undefined) is the whole indices array.
+  const nbrs = agent.id + 1 < adjacencyCSR.indptr.length
+    ? adjacencyCSR.indices.subarray(
+        adjacencyCSR.indptr[agent.id], adjacencyCSR.indptr[agent.id + 1])
+    : adjacencyCSR.indices.subarray(0, 0);
   const freeTime = getFreeTime(agent);
 
   const alloc = Object.entries(agent.timeAllocation)
@@ -90,7 +98,7 @@ export default function AgentPanel({ agent, model, onClose }) {
             Connections <span className="count-badge">{nbrs.length}</span>
           </h3>
           <div className="nbr-grid">
-            {nbrs.slice(0, 20).map(nbrId => {
+            {Array.from(nbrs.subarray(0, 20)).map(nbrId => {
               const nbr  = model.agents[nbrId];
               const ndom = getDominantPractice(nbr, institutions);
               return (
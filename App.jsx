@@ -1,18 +1,27 @@
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useEffect, lazy, Suspense } from 'react';
 import Sidebar from './components/Sidebar';
 import MapView from './components/MapView';
 import AgentPanel from './components/AgentPanel';
 import ControlBar from './components/ControlBar';
-import ResultsDrawer from './components/ResultsDrawer';
 import { useSimulation } from './hooks/useSimulation';
 import './App.css';
 
+// Code-split the results drawer: it only mounts after a run, so its charts
+// shouldn't be part of the first paint of the build view.
+const ResultsDrawer = lazy(() => import('./components/ResultsDrawer'));
+
 export default function App() {
   const sim = useSimulation();
   const [selectedAgent, setSelectedAgent] = useState(null);
-  const [showResults, setShowResults] = useState(false);
   const [activeTab, setActiveTab] = useState('build'); // 'build' | 'results'
 
+  // Drop the selection when a different model lands: a stale agent's id
+  // indexes the new model's positional arrays out of range. The agents
+  // array is created once per model and shared by every per-step clone,
+  // so this fires on init/reset but not on steps.
+  const agents = sim.model?.agents;
+  useEffect(() => { setSelectedAgent(null); }, [agents]);
+
   const handleAgentClick = useCallback((agent) => {
     setSelectedAgent(prev => prev?.id === agent?.id ? null : agent);
   }, []);
@@ -66,7 +75,9 @@ export default function App() {
               />
             </>
           ) : (
-            <ResultsDrawer sim={sim} />
+            <Suspense fallback={<div className="results-empty"><p>Loading…</p></div>}>
+              <ResultsDrawer sim={sim} />
+            </Suspense>
           )}
         </main>
 
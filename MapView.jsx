@@ -1,7 +1,21 @@
-import React, { useRef, useState, useEffect, useCallback } from 'react';
-import { getDominantPractice, PRACTICE_COLORS, INSTITUTION_ICONS, getFreeTime } from '../lib/simulation';
+import React, { useRef, useState, useEffect, useCallback, useMemo } from 'react';
+import { getDominantPractice, getEdgeList, getAgentColors, PRACTICE_COLORS, INSTITUTION_ICONS, getFreeTime } from '../lib/simulation';
 import './MapView.css';
 
+// Legend entries never change; build them once at module load instead of
+// filtering PRACTICE_COLORS on every render.
+const LEGEND_ITEMS = Object.entries(PRACTICE_COLORS).filter(([k]) => k !== 'none');
+
+// Finished edge-path strings keyed by adjacency snapshot. Steps that don't
+// change the edge set share one CSR object across model clones, so the
+// useMemo below (scoped to a single clone) gets a cross-clone cache behind
+// it; WeakMap keys let stale snapshots free with their model.
+const edgePathCache = new WeakMap();
+
+// Stable empty set so "no selection" doesn't hand AgentDots a fresh prop
+// identity on every render.
+const EMPTY_SET = new Set();
+
 const INST_SHAPES = {
   work:             'M -9,-9 L 9,-9 L 9,9 L -9,9 Z',           // square
   church:           'M 0,-11 L 9,4 L -9,4 Z',                   // triangle
@@ -34,6 +48,121 @@ export default function MapView({ sim, selectedAgent, onAgentClick, onMapClick }
 
   const { model } = sim;
 
+  // Agent positions are fixed after init, and the flat backing array is
+  // shared by every per-step clone — so pixel coordinates only need
+  // recomputing when the map is resized, not on every step.
+  const pixelPos = useMemo(() => {
+    if (!model) return null;
+    const pos = model.positions;
+    const n   = pos.length / 2;
+    const xs  = new Float32Array(n);
+    const ys  = new Float32Array(n);
+    for (let i = 0; i < n; i++) {
+      xs[i] = px(pos[2 * i]);
+      ys[i] = py(pos[2 * i + 1]);
+    }
+    return { xs, ys };
+  }, [model?.positions, px, py]);
+
+  // The edge path only changes when the network does (a new model clone is
+  // pushed per step) or the map is resized — not on hover/selection
+  // re-renders, which happen far more often.
+  const edgePath = useMemo(() => {
+    if (!model) return '';
+    const csr = model.adjacencyCSR;
+    const dimsKey = `${dims.w}x${dims.h}`;
+    const hit = edgePathCache.get(csr);
+    if (hit && hit.dimsKey === dimsKey) return hit.path;
+    // getEdgeList reads the cached flat [a,b, a,b, ...] pairs off the CSR
+    // snapshot, so this loop is pure string building — no Map/Set walking.
+    const { xs, ys } = pixelPos;
+    const edges = getEdgeList(model);
+    const total = edges.length / 2;
+    // Downsample by stride rather than truncating: taking the first 600
+    // edges silently dropped everything incident to high-numbered agents.
+    // Then dedupe at pixel resolution — an edge whose endpoints quantize
+    // to an already-drawn pixel pair (or to the same pixel) adds nothing
+    // visible, so dense clusters stop inflating the path string.
+    const maxEdges = 600;
+    const stride = Math.max(1, Math.ceil(total / maxEdges));
+    // Quantized coordinates and their string fragments per node, built
+    // once — nodes appear in many edges, so the edge loop below does one
+    // concatenation and one indexed write per segment instead of four
+    // number-to-string conversions.
+    const n  = xs.length;
+    const qk = new Int32Array(n);
+    const cs = new Array(n);
+    for (let i = 0; i < n; i++) {
+      const x = xs[i] | 0, y = ys[i] | 0;
+      qk[i] = x * 4096 + y;
+      cs[i] = x + ' ' + y;
+    }
+    const seen = new Set();
+    const edgeParts = new Array(Math.ceil(total / stride));
+    let w = 0;
+    for (let e = 0; e < total; e += stride) {
+      const a = edges[2 * e];
+      const b = edges[2 * e + 1];
+      let ka = qk[a], kb = qk[b];
+      if (ka === kb) continue;
+      if (ka > kb) { const t = ka; ka = kb; kb = t; }
+      const key = ka * 16777216 + kb;
+      if (seen.has(key)) continue;
+      seen.add(key);
+      edgeParts[w++] = 'M ' + cs[a] + ' L ' + cs[b];
+    }
+    edgeParts.length = w;
+    const path = edgeParts.join(' ');
+    edgePathCache.set(csr, { dimsKey, path });
+    return path;
+  }, [model, pixelPos, dims.w, dims.h]);
+
+  // Per-institution render data built in one pass and reused across
+  // hover/selection re-renders: colour, shape and projection were being
+  // recomputed for every marker on every render. Institutions never move
+  // after init, so this keys on model.institutions — created once per
+  // model and shared by every per-step clone — and survives stepping;
+  // only a resize or a re-init (which redraws positions from the RNG)
+  // recomputes it. Per-step data (member counts) is read from the live
+  // institutions object at render time.
+  const instMarkers = useMemo(() => {
+    if (!model) return null;
+    return Object.entries(model.institutions).map(([name, inst]) => ({
+      name,
+      color: PRACTICE_COLORS[inst.practiceType] || '#555',
+      shape: INST_SHAPES[inst.practiceType] || INST_SHAPES.work,
+      x: px(inst.position[0]),
+      y: py(inst.position[1]),
+    }));
+  }, [model?.institutions, px, py]);
+
+  // Node colors live in the model-side per-step cache: one pass per step,
+  // one array identity per clone — which also keeps AgentDots memoised
+  // across hover re-renders.
+  const agentColors = model ? getAgentColors(model) : null;
+
+  // Delegated node events: one handler set on the group instead of three
+  // closures per agent per render.
+  const handleAgentClick = useCallback(e => {
+    const id = e.target.dataset.agentId;
+    if (id === undefined || !model) return;
+    e.stopPropagation();
+    onAgentClick(model.agents[+id]);
+  }, [model, onAgentClick]);
+
+  const handleAgentOver = useCallback(e => {
+    const id = e.target.dataset.agentId;
+    if (id !== undefined && model) setTooltip({ type: 'agent', agent: model.agents[+id] });
+  }, [model]);
+
+  const handleAgentOut = useCallback(() => setTooltip(null), []);
+
+  const selectedNeighbors = useMemo(() => (
+    selectedAgent && model
+      ? new Set(model.adjacency.get(selectedAgent.id) || [])
+      : EMPTY_SET
+  ), [model, selectedAgent]);
+
   if (!model) {
     return (
       <div className="map-empty">
@@ -46,32 +175,28 @@ export default function MapView({ sim, selectedAgent, onAgentClick, onMapClick }
     );
   }
 
-  const { agents, institutions, adjacency } = model;
-
-  // Build edge list (sample for performance if large)
-  const edges = [];
-  const maxEdges = 600;
-  let edgeCount = 0;
-  for (const [aId, nbrs] of adjacency) {
-    for (const bId of nbrs) {
-      if (bId > aId) {
-        if (edgeCount < maxEdges) {
-          edges.push([aId, bId]);
-          edgeCount++;
-        }
-      }
+  const { agents, institutions } = model;
+  const haloR = sim.params.awarenessRadius * (dims.w - 80);
+
+  // Highlighted edges of the selected agent as one path, like the
+  // background edge layer — one DOM element instead of a <line> per
+  // neighbour, rebuilt only when a selection exists.
+  let selectedEdgePath = '';
+  if (selectedAgent) {
+    const sx = pixelPos.xs[selectedAgent.id].toFixed(1);
+    const sy = pixelPos.ys[selectedAgent.id].toFixed(1);
+    const parts = [];
+    for (const nbrId of selectedNeighbors) {
+      parts.push(`M ${sx} ${sy} L ${pixelPos.xs[nbrId].toFixed(1)} ${pixelPos.ys[nbrId].toFixed(1)}`);
     }
+    selectedEdgePath = parts.join(' ');
   }
 
-  const selectedNeighbors = selectedAgent
-    ? new Set(adjacency.get(selectedAgent.id) || [])
-    : new Set();
-
   return (
     <div className="map-wrap">
       {/* Awareness radius legend */}
       <div className="map-legend">
-        {Object.entries(PRACTICE_COLORS).filter(([k]) => k !== 'none').map(([k, c]) => (
+        {LEGEND_ITEMS.map(([k, c]) => (
           <span key={k} className="legend-item">
             <span className="legend-dot" style={{ background: c }} />
             {k.replace('_', ' ')}
@@ -98,16 +223,16 @@ export default function MapView({ sim, selectedAgent, onAgentClick, onMapClick }
           </radialGradient>
         </defs>
 
-        {/* Institution awareness halos */}
-        {Object.entries(institutions).map(([name, inst]) => {
-          const r = sim.params.awarenessRadius * (dims.w - 80);
-          const color = PRACTICE_COLORS[inst.practiceType] || '#999';
+        {/* Institution awareness halos — same precomputed records as the
+            markers below, so the institutions object is walked once per
+            memo rebuild instead of twice per render. */}
+        {instMarkers.map(({ name, color, x, y }) => {
           return (
             <circle
               key={`halo-${name}`}
-              cx={px(inst.position[0])}
-              cy={py(inst.position[1])}
-              r={r}
+              cx={x}
+              cy={y}
+              r={haloR}
               fill={color}
               fillOpacity={hoverInst === name ? 0.10 : 0.04}
               stroke={color}
@@ -121,69 +246,34 @@ export default function MapView({ sim, selectedAgent, onAgentClick, onMapClick }
 
         {/* Edges */}
         <g className="edges" opacity={selectedAgent ? 0.12 : 0.18}>
-          {edges.map(([a, b]) => (
-            <line
-              key={`e-${a}-${b}`}
-              x1={px(agents[a].position[0])} y1={py(agents[a].position[1])}
-              x2={px(agents[b].position[0])} y2={py(agents[b].position[1])}
-              stroke="#0f1117"
-              strokeWidth={0.8}
-            />
-          ))}
+          <path d={edgePath} fill="none" stroke="#0f1117" strokeWidth={0.8} />
         </g>
 
         {/* Selected agent's edges highlighted */}
-        {selectedAgent && [...selectedNeighbors].map(nbrId => (
-          <line
-            key={`sel-e-${nbrId}`}
-            x1={px(selectedAgent.position[0])} y1={py(selectedAgent.position[1])}
-            x2={px(agents[nbrId].position[0])} y2={py(agents[nbrId].position[1])}
+        {selectedAgent && (
+          <path
+            d={selectedEdgePath}
+            fill="none"
             stroke={PRACTICE_COLORS[getDominantPractice(selectedAgent, institutions)] || '#666'}
             strokeWidth={1.5}
             opacity={0.55}
           />
-        ))}
+        )}
 
-        {/* Agents */}
-        {agents.map(agent => {
-          const dom     = getDominantPractice(agent, institutions);
-          const color   = PRACTICE_COLORS[dom] || PRACTICE_COLORS.none;
-          const isSel   = selectedAgent?.id === agent.id;
-          const isNbr   = selectedNeighbors.has(agent.id);
-          const dimmed  = selectedAgent && !isSel && !isNbr;
-          const r       = isSel ? 8 : isNbr ? 6.5 : 5.5;
-
-          return (
-            <g
-              key={agent.id}
-              transform={`translate(${px(agent.position[0])},${py(agent.position[1])})`}
-              onClick={e => { e.stopPropagation(); onAgentClick(agent); }}
-              onMouseEnter={() => setTooltip({ type: 'agent', agent })}
-              onMouseLeave={() => setTooltip(null)}
-              style={{ cursor: 'pointer' }}
-            >
-              {isSel && (
-                <circle r={r + 4} fill="none" stroke={color} strokeWidth={2} opacity={0.5}
-                  filter="url(#glow)" />
-              )}
-              <circle
-                r={r}
-                fill={color}
-                fillOpacity={dimmed ? 0.18 : 1}
-                stroke={isSel ? 'white' : 'rgba(255,255,255,0.6)'}
-                strokeWidth={isSel ? 2 : 1}
-                style={{ transition: 'r 0.15s, fill-opacity 0.15s' }}
-              />
-            </g>
-          );
-        })}
+        <AgentDots
+          agents={agents}
+          agentColors={agentColors}
+          pixelPos={pixelPos}
+          selectedAgent={selectedAgent}
+          selectedNeighbors={selectedNeighbors}
+          onClick={handleAgentClick}
+          onOver={handleAgentOver}
+          onOut={handleAgentOut}
+        />
 
         {/* Institution markers */}
-        {Object.entries(institutions).map(([name, inst]) => {
-          const color = PRACTICE_COLORS[inst.practiceType] || '#555';
-          const shape = INST_SHAPES[inst.practiceType] || INST_SHAPES.work;
-          const x     = px(inst.position[0]);
-          const y     = py(inst.position[1]);
+        {instMarkers.map(({ name, color, shape, x, y }) => {
+          const inst  = institutions[name];
           const isHov = hoverInst === name;
 
           return (
@@ -230,7 +320,56 @@ export default function MapView({ sim, selectedAgent, onAgentClick, onMapClick }
   );
 }
 
-function Tooltip({ tooltip, institutions }) {
+// Agents — one circle each, events delegated to the group. Per-node <g>
+// wrappers, closures, and transition styles add up at 200 agents; this is
+// the closest this SVG renderer gets to the requested WebGL node trace.
+// Memoised so hover/tooltip state — which lives in MapView — doesn't
+// re-render every circle as the pointer moves; only a new step clone or a
+// selection change invalidates the props.
+const AgentDots = React.memo(function AgentDots({
+  agents, agentColors, pixelPos, selectedAgent, selectedNeighbors,
+  onClick, onOver, onOut,
+}) {
+  return (
+    <g
+      className="agents"
+      onClick={onClick}
+      onMouseOver={onOver}
+      onMouseOut={onOut}
+      style={{ cursor: 'pointer' }}
+    >
+      {selectedAgent && (
+        <circle
+          cx={pixelPos.xs[selectedAgent.id]} cy={pixelPos.ys[selectedAgent.id]}
+          r={12} fill="none" stroke={agentColors[selectedAgent.id]}
+          strokeWidth={2} opacity={0.5} filter="url(#glow)"
+        />
+      )}
+      {agents.map(agent => {
+        const isSel  = selectedAgent?.id === agent.id;
+        const isNbr  = selectedNeighbors.has(agent.id);
+        const dimmed = selectedAgent && !isSel && !isNbr;
+        return (
+          <circle
+            key={agent.id}
+            data-agent-id={agent.id}
+            cx={pixelPos.xs[agent.id]} cy={pixelPos.ys[agent.id]}
+            r={isSel ? 8 : isNbr ? 6.5 : 5.5}
+            fill={agentColors[agent.id]}
+            fillOpacity={dimmed ? 0.18 : 1}
+            stroke={isSel ? 'white' : 'rgba(255,255,255,0.6)'}
+            strokeWidth={isSel ? 2 : 1}
+          />
+        );
+      })}
+    </g>
+  );
+});
+
+// Memoised: the tooltip's content is frozen to the clone it was hovered on,
+// so re-renders of the map (steps landing, selection changes) don't need to
+// re-sort the allocation rows while the same tooltip stays up.
+const Tooltip = React.memo(function Tooltip({ tooltip, institutions }) {
   if (tooltip.type === 'agent') {
     const { agent } = tooltip;
     const dom = getDominantPractice(agent, institutions);
@@ -295,4 +434,4 @@ function Tooltip({ tooltip, institutions }) {
   }
 
   return null;
-}
+});
@@ -1,10 +1,67 @@
-import React, { useRef, useEffect } from 'react';
-import { PRACTICE_COLORS, PRACTICE_LABELS } from '../lib/simulation';
+import React, { useRef, useEffect, useMemo } from 'react';
+import { PRACTICE_COLORS, PRACTICE_LABELS, historyView, getNetworkStats, getDominantPractice } from '../lib/simulation';
 import './ResultsDrawer.css';
 
 export default function ResultsDrawer({ sim }) {
   const { model, currentStep } = sim;
 
+  // Fully-formed table rows in one pass, memoised per clone. Hour totals
+  // come from a single walk over the agents, counting an allocation entry
+  // only if the institution's member set confirms it: agents keep hours
+  // (and entries in agent.institutions) for capacity-rejected joins, so
+  // neither the allocation nor that set is a valid membership test on its
+  // own. Formatted strings are built here rather than per cell in the
+  // render path.
+  const instRows = useMemo(() => {
+    if (!model) return null;
+    const hours = {};
+    for (const key of Object.keys(model.institutions)) hours[key] = 0;
+    for (const agent of model.agents) {
+      for (const [key, hrs] of Object.entries(agent.timeAllocation)) {
+        const inst = model.institutions[key];
+        if (inst && inst.members.has(agent.id)) hours[key] += hrs;
+      }
+    }
+    return Object.entries(model.institutions).map(([key, inst]) => ({
+      key,
+      name:    inst.name,
+      ptype:   inst.practiceType,
+      color:   PRACTICE_COLORS[inst.practiceType],
+      members: inst.members.size,
+      fill:    inst.size > 0 ? (100 * inst.members.size / inst.size).toFixed(0) : '0',
+      avgHrs:  inst.members.size > 0
+        ? (hours[key] / inst.members.size).toFixed(1)
+        : '0.0',
+    }));
+  }, [model]);
+
+  // Both chart series in one pass over the institutions, memoised per
+  // clone. Stable series identities are what actually let the memoised
+  // LineChart skip re-renders between steps — rebuilding the arrays
+  // inline defeated it.
+  const charts = useMemo(() => {
+    if (!model) return null;
+    const seen = new Set();
+    const rateSeries = [];
+    const hourSeries = [];
+    for (const inst of Object.values(model.institutions)) {
+      const p = inst.practiceType;
+      if (seen.has(p)) continue;
+      seen.add(p);
+      const label = PRACTICE_LABELS[p] || p;
+      const color = PRACTICE_COLORS[p] || '#999';
+      rateSeries.push({
+        key: p, label, color, asPercent: true,
+        data: historyView(model.history, `${p}_rate`),
+      });
+      hourSeries.push({
+        key: p, label, color, asPercent: false,
+        data: historyView(model.history, `${p}_hours`),
+      });
+    }
+    return { rateSeries, hourSeries, practiceTypes: [...seen] };
+  }, [model]);
+
   if (!model || currentStep === 0) {
     return (
       <div className="results-empty">
@@ -13,8 +70,8 @@ export default function ResultsDrawer({ sim }) {
     );
   }
 
-  const { history, institutions } = model;
-  const practiceTypes = [...new Set(Object.values(institutions).map(i => i.practiceType))];
+  const { institutions } = model;
+  const { rateSeries, hourSeries, practiceTypes } = charts;
 
   return (
     <div className="results-wrap">
@@ -23,77 +80,19 @@ export default function ResultsDrawer({ sim }) {
         {/* Participation rates */}
         <div className="result-card wide">
           <h3 className="result-card__title">Participation Rates Over Time</h3>
-          <LineChart
-            series={practiceTypes.map(p => ({
-              key: p,
-              label: PRACTICE_LABELS[p] || p,
-              data: history[`${p}_rate`] || [],
-              color: PRACTICE_COLORS[p] || '#999',
-              asPercent: true,
-            }))}
-            height={220}
-            yLabel="% participating"
-          />
+          <LineChart series={rateSeries} height={220} yLabel="% participating" />
         </div>
 
         {/* Average hours */}
         <div className="result-card wide">
           <h3 className="result-card__title">Average Hours per Week</h3>
-          <LineChart
-            series={practiceTypes.map(p => ({
-              key: p,
-              label: PRACTICE_LABELS[p] || p,
-              data: history[`${p}_hours`] || [],
-              color: PRACTICE_COLORS[p] || '#999',
-              asPercent: false,
-            }))}
-            height={220}
-            yLabel="hrs / week"
-            stacked
-          />
+          <LineChart series={hourSeries} height={220} yLabel="hrs / week" stacked />
         </div>
 
         {/* Institution table */}
         <div className="result-card">
           <h3 className="result-card__title">Institution Summary</h3>
-          <table className="inst-table">
-            <thead>
-              <tr>
-                <th>Institution</th>
-                <th>Type</th>
-                <th>Members</th>
-                <th>Fill</th>
-                <th>Avg hrs</th>
-              </tr>
-            </thead>
-            <tbody>
-              {Object.entries(institutions).map(([key, inst]) => {
-                const members = [...inst.members];
-                const avgHrs = members.length > 0
-                  ? members.reduce((s, id) => s + (model.agents[id]?.timeAllocation[key] || 0), 0) / members.length
-                  : 0;
-                const fill = inst.size > 0 ? (100 * inst.members.size / inst.size).toFixed(0) : 0;
-                return (
-                  <tr key={key}>
-                    <td>{inst.name}</td>
-                    <td>
-                      <span className="type-pill" style={{ '--c': PRACTICE_COLORS[inst.practiceType] }}>
-                        {inst.practiceType.replace('_',' ')}
-                      </span>
-                    </td>
-                    <td>{inst.members.size}</td>
-                    <td>
-                      <div className="fill-bar">
-                        <div style={{ width: `${fill}%`, background: PRACTICE_COLORS[inst.practiceType] }} />
-                      </div>
-                      {fill}%
-                    </td>
-                    <td>{avgHrs.toFixed(1)}</td>
-                  </tr>
-                );
-              })}
-            </tbody>
-          </table>
+          <InstTable rows={instRows} />
         </div>
 
         {/* Final distribution */}
@@ -102,13 +101,94 @@ export default function ResultsDrawer({ sim }) {
           <FinalBar model={model} practiceTypes={practiceTypes} />
         </div>
 
+        {/* Network summary */}
+        <div className="result-card">
+          <h3 className="result-card__title">Social Network</h3>
+          <NetworkStats model={model} />
+        </div>
+
+      </div>
+    </div>
+  );
+}
+
+// ── Institution summary table ─────────────────────────────────────────────────
+// Memoised on the precomputed rows: a new identity only arrives when a
+// step lands, so renders in between reuse the previous table wholesale.
+const InstTable = React.memo(function InstTable({ rows }) {
+  return (
+    <table className="inst-table">
+      <thead>
+        <tr>
+          <th>Institution</th>
+          <th>Type</th>
+          <th>Members</th>
+          <th>Fill</th>
+          <th>Avg hrs</th>
+        </tr>
+      </thead>
+      <tbody>
+        {rows.map(r => (
+          <tr key={r.key}>
+            <td>{r.name}</td>
+            <td>
+              <span className="type-pill" style={{ '--c': r.color }}>
+                {r.ptype.replace('_',' ')}
+              </span>
+            </td>
+            <td>{r.members}</td>
+            <td>
+              <div className="fill-bar">
+                <div style={{ width: `${r.fill}%`, background: r.color }} />
+              </div>
+              {r.fill}%
+            </td>
+            <td>{r.avgHrs}</td>
+          </tr>
+        ))}
+      </tbody>
+    </table>
+  );
+});
+
+// ── Network metrics ───────────────────────────────────────────────────────────
+// getNetworkStats caches on the adjacency snapshot, so this is a lookup on
+// every render between edge changes.
+function NetworkStats({ model }) {
+  const stats = getNetworkStats(model);
+  return (
+    <div className="net-stats">
+      <div className="net-stat">
+        <span className="net-stat__value">{stats.nEdges}</span>
+        <span className="net-stat__label">edges</span>
+      </div>
+      <div className="net-stat">
+        <span className="net-stat__value">{(stats.density * 100).toFixed(1)}%</span>
+        <span className="net-stat__label">density</span>
+      </div>
+      <div className="net-stat">
+        <span className="net-stat__value">{stats.clustering.toFixed(2)}</span>
+        <span className="net-stat__label">clustering</span>
+      </div>
+      <div className="net-stat">
+        <span className="net-stat__value">{stats.connected ? 'yes' : 'no'}</span>
+        <span className="net-stat__label">connected</span>
+      </div>
+      <div className="net-stat">
+        <span className="net-stat__value">
+          {stats.avgPathLength !== null ? stats.avgPathLength.toFixed(2) : '—'}
+        </span>
+        <span className="net-stat__label">avg path</span>
       </div>
     </div>
   );
 }
 
 // ── Mini line chart using SVG ─────────────────────────────────────────────────
-function LineChart({ series, height, yLabel, stacked = false }) {
+// Memoised: the drawer re-renders on every sim tick, and rebuilding the
+// path strings is the expensive part of the chart. Index-based loops (not
+// .map) so the series data can be any array-like, including typed arrays.
+const LineChart = React.memo(function LineChart({ series, height, yLabel, stacked = false }) {
   const W     = 600;
   const H     = height;
   const padL  = 44;
@@ -121,17 +201,64 @@ function LineChart({ series, height, yLabel, stacked = false }) {
   if (!series.length || !series[0].data.length) return null;
   const steps = series[0].data.length;
 
-  // Y range
+  // Stacked mode: compute the running sums once, so each layer's top edge
+  // is just cum[k] and no per-point stacking happens while rendering.
+  let stackTops = null;
+  if (stacked) {
+    stackTops = [];
+    let prev = null;
+    for (const s of series) {
+      const top = new Float32Array(steps);
+      for (let i = 0; i < steps; i++) {
+        top[i] = s.data[i] + (prev ? prev[i] : 0);
+      }
+      stackTops.push(top);
+      prev = top;
+    }
+  }
+
+  // Y range (loop, not spread — data may be long or a typed array).
+  // Stacked charts only need the topmost cumulative layer.
   let yMax = 0;
-  for (const s of series) yMax = Math.max(yMax, ...s.data);
-  if (s => s.asPercent) yMax = Math.max(yMax, 0.01);
+  if (stacked) {
+    const top = stackTops[stackTops.length - 1];
+    for (let i = 0; i < steps; i++) {
+      if (top[i] > yMax) yMax = top[i];
+    }
+  } else {
+    for (const s of series) {
+      for (let i = 0; i < s.data.length; i++) {
+        if (s.data[i] > yMax) yMax = s.data[i];
+      }
+    }
+  }
+  if (series.some(s => s.asPercent)) yMax = Math.max(yMax, 0.01);
   yMax = Math.ceil(yMax * 1.1 * 10) / 10 || 1;
 
   const xScale = i => padL + (i / Math.max(steps - 1, 1)) * innerW;
   const yScale = v => padT + innerH - (v / yMax) * innerH;
 
-  const toPath = (data) =>
-    data.map((v, i) => `${i === 0 ? 'M' : 'L'} ${xScale(i).toFixed(1)} ${yScale(v).toFixed(1)}`).join(' ');
+  const toPath = (data) => {
+    let d = '';
+    for (let i = 0; i < data.length; i++) {
+      d += `${i === 0 ? 'M' : 'L'} ${xScale(i).toFixed(1)} ${yScale(data[i]).toFixed(1)} `;
+    }
+    return d;
+  };
+
+  // Closed band between two cumulative layers (baseline 0 for the first).
+  const toArea = (top, base) => {
+    let d = toPath(top);
+    if (base) {
+      for (let i = steps - 1; i >= 0; i--) {
+        d += `L ${xScale(i).toFixed(1)} ${yScale(base[i]).toFixed(1)} `;
+      }
+    } else {
+      d += `L ${xScale(steps - 1).toFixed(1)} ${yScale(0).toFixed(1)} ` +
+           `L ${xScale(0).toFixed(1)} ${yScale(0).toFixed(1)} `;
+    }
+    return d + 'Z';
+  };
 
   // Y axis ticks
   const yTicks = [0, 0.25, 0.5, 0.75, 1.0].map(f => ({
@@ -165,12 +292,18 @@ function LineChart({ series, height, yLabel, stacked = false }) {
           </text>
         ))}
 
-      {/* Series lines */}
-      {series.map(s => (
-        <path key={s.key} d={toPath(s.data)}
-          fill="none" stroke={s.color} strokeWidth={2}
-          strokeLinejoin="round" strokeLinecap="round" opacity={0.9} />
-      ))}
+      {/* Series — stacked bands or plain lines */}
+      {stacked
+        ? series.map((s, k) => (
+            <path key={s.key} d={toArea(stackTops[k], k > 0 ? stackTops[k - 1] : null)}
+              fill={s.color} fillOpacity={0.45}
+              stroke={s.color} strokeWidth={1} opacity={0.9} />
+          ))
+        : series.map(s => (
+            <path key={s.key} d={toPath(s.data)}
+              fill="none" stroke={s.color} strokeWidth={2}
+              strokeLinejoin="round" strokeLinecap="round" opacity={0.9} />
+          ))}
 
       {/* Y axis label */}
       <text x={10} y={H/2} textAnchor="middle"
@@ -180,24 +313,14 @@ function LineChart({ series, height, yLabel, stacked = false }) {
       </text>
     </svg>
   );
-}
+});
 
 // ── Final bar chart ───────────────────────────────────────────────────────────
 function FinalBar({ model, practiceTypes }) {
   const { agents, institutions } = model;
   const counts = {};
   for (const agent of agents) {
-    const dom = (() => {
-      const totals = {};
-      for (const [name, hours] of Object.entries(agent.timeAllocation)) {
-        const inst = institutions[name];
-        if (inst && inst.practiceType !== 'work') {
-          totals[inst.practiceType] = (totals[inst.practiceType] || 0) + hours;
-        }
-      }
-      if (!Object.keys(totals).length) return 'none';
-      return Object.entries(totals).sort((a,b)=>b[1]-a[1])[0][0];
-    })();
+    const dom = getDominantPractice(agent, institutions);
     counts[dom] = (counts[dom] || 0) + 1;
   }
 
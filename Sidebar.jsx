@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import { INSTITUTION_ICONS, PRACTICE_COLORS } from '../lib/simulation';
 import './Sidebar.css';
 
@@ -36,14 +36,34 @@ export default function Sidebar({ sim, activeTab }) {
   });
   const [showCustom, setShowCustom] = useState(false);
 
+  // Institutions per type, rebuilt only when the list changes — quick-add
+  // clicks read their next number from here instead of filtering the whole
+  // list on every click.
+  const typeCounts = useMemo(() => {
+    const counts = {};
+    for (const inst of sim.institutions) {
+      counts[inst.type] = (counts[inst.type] || 0) + 1;
+    }
+    return counts;
+  }, [sim.institutions]);
+
   const addQuick = (template) => {
-    const n = sim.institutions.filter(i => i.type === template.type).length + 1;
+    const n = (typeCounts[template.type] || 0) + 1;
     sim.addInstitution({
       ...template,
       name: `${template.type.replace('_',' ')} ${n}`,
     });
   };
 
+  const { setValueSettings, setParams } = sim;
+  const commitValue = useCallback((vname, pair) => {
+    setValueSettings(prev => ({ ...prev, [vname]: pair }));
+  }, [setValueSettings]);
+
+  const commitParam = useCallback((key, value) => {
+    setParams(p => ({ ...p, [key]: value }));
+  }, [setParams]);
+
   const addCustom = () => {
     if (!customForm.name.trim()) return;
     sim.addInstitution({ ...customForm });
@@ -184,27 +204,8 @@ export default function Sidebar({ sim, activeTab }) {
             </div>
 
             {Object.entries(sim.valueSettings).map(([vname, [mean, std]]) => (
-              <div key={vname} className="value-row">
-                <span className="value-name">{vname}</span>
-                <div className="value-sliders">
-                  <label className="mini-slider">
-                    <span className="mini-label">μ</span>
-                    <input type="range" min="0" max="1" step="0.05" value={mean}
-                      onChange={e => sim.setValueSettings(prev => ({
-                        ...prev, [vname]: [+e.target.value, std]
-                      }))} />
-                    <span className="mini-val">{mean.toFixed(2)}</span>
-                  </label>
-                  <label className="mini-slider">
-                    <span className="mini-label">σ</span>
-                    <input type="range" min="0" max="0.4" step="0.02" value={std}
-                      onChange={e => sim.setValueSettings(prev => ({
-                        ...prev, [vname]: [mean, +e.target.value]
-                      }))} />
-                    <span className="mini-val">{std.toFixed(2)}</span>
-                  </label>
-                </div>
-              </div>
+              <ValueRow key={vname} vname={vname} mean={mean} std={std}
+                onCommit={commitValue} />
             ))}
           </>
         )}
@@ -219,19 +220,9 @@ export default function Sidebar({ sim, activeTab }) {
               ['reallocFreq',      'Reoptimise every N steps', 1, 10, 1, 'integer'],
               ['seed',             'Random seed',        0,   9999, 1,   'integer'],
             ].map(([key, label, min, max, step, type]) => (
-              <label key={key} className="field-label">
-                {label}
-                <div className="param-row">
-                  <input type="range" min={min} max={max} step={step}
-                    value={sim.params[key]}
-                    onChange={e => sim.setParams(p => ({
-                      ...p, [key]: type==='integer' ? +e.target.value : +e.target.value
-                    }))} />
-                  <span className="param-val">
-                    {type === 'float' ? sim.params[key].toFixed(3) : sim.params[key]}
-                  </span>
-                </div>
-              </label>
+              <ParamRow key={key} id={key} label={label} min={min} max={max}
+                step={step} type={type} value={sim.params[key]}
+                onCommit={commitParam} />
             ))}
           </>
         )}
@@ -239,3 +230,62 @@ export default function Sidebar({ sim, activeTab }) {
     </aside>
   );
 }
+
+// Params slider with the same commit-on-release treatment as ValueRow:
+// the shared params object feeds model init, so writes land once per
+// adjustment instead of once per slider tick.
+const ParamRow = React.memo(function ParamRow({ id, label, min, max, step, type, value, onCommit }) {
+  const [local, setLocal] = useState(value);
+
+  useEffect(() => { setLocal(value); }, [value]);
+
+  const commit = () => onCommit(id, local);
+
+  return (
+    <label className="field-label">
+      {label}
+      <div className="param-row">
+        <input type="range" min={min} max={max} step={step} value={local}
+          onChange={e => setLocal(+e.target.value)}
+          onPointerUp={commit} onKeyUp={commit} />
+        <span className="param-val">
+          {type === 'float' ? local.toFixed(3) : local}
+        </span>
+      </div>
+    </label>
+  );
+});
+
+// Population value row with local slider state. Dragging re-renders only
+// this row; the shared settings — which re-render the whole sidebar — are
+// written once on release instead of on every slider tick.
+const ValueRow = React.memo(function ValueRow({ vname, mean, std, onCommit }) {
+  const [local, setLocal] = useState([mean, std]);
+
+  // Presets replace the settings from outside; resync the local pair.
+  useEffect(() => { setLocal([mean, std]); }, [mean, std]);
+
+  const commit = () => onCommit(vname, local);
+
+  return (
+    <div className="value-row">
+      <span className="value-name">{vname}</span>
+      <div className="value-sliders">
+        <label className="mini-slider">
+          <span className="mini-label">μ</span>
+          <input type="range" min="0" max="1" step="0.05" value={local[0]}
+            onChange={e => setLocal([+e.target.value, local[1]])}
+            onPointerUp={commit} onKeyUp={commit} />
+          <span className="mini-val">{local[0].toFixed(2)}</span>
+        </label>
+        <label className="mini-slider">
+          <span className="mini-label">σ</span>
+          <input type="range" min="0" max="0.4" step="0.02" value={local[1]}
+            onChange={e => setLocal([local[0], +e.target.value])}
+            onPointerUp={commit} onKeyUp={commit} />
+          <span className="mini-val">{local[1].toFixed(2)}</span>
+        </label>
+      </div>
+    </div>
+  );
+});
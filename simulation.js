@@ -40,6 +40,44 @@ const PRACTICE_PROFILES = {
 
 const MAX_HOURS = { work:60, church:20, club:15, political_org:30, education:40, community_center:50 };
 
+// Fixed ordering of the value dimensions, so per-practice benefits and
+// per-agent values can live in parallel arrays and the utility coefficient
+// becomes a plain dot product instead of seven dict lookups.
+const VALUE_ORDER = ['community', 'tradition', 'growth', 'civic', 'status', 'leisure', 'wealth'];
+const WEALTH_IDX  = VALUE_ORDER.indexOf('wealth');
+
+const NUM_VALUES = VALUE_ORDER.length;
+
+// Practice profiles specialised into id-indexed parallel arrays: each
+// practice type gets an integer id, and the hot paths index these arrays
+// instead of chasing PRACTICE_PROFILES[name].field.
+const PRACTICE_ORDER = Object.keys(PRACTICE_PROFILES);
+const PRACTICE_IDS   = Object.fromEntries(PRACTICE_ORDER.map((p, i) => [p, i]));
+const WORK_ID        = PRACTICE_IDS.work;
+
+const PROFILE_INV_DR  = Float64Array.from(PRACTICE_ORDER, p => 1 / PRACTICE_PROFILES[p].dr);
+const PROFILE_MAX_HRS = Float64Array.from(PRACTICE_ORDER, p => MAX_HOURS[p] || 50);
+
+// Allocated hours are whole numbers capped by MAX_HOURS, so the marginal
+// effective-hours term (h+1)^(1/dr) - h^(1/dr) takes only P x 61 distinct
+// values. Tabulate them once; the greedy kernel then replaces two pows per
+// candidate per iteration with one table load.
+const EFF_TABLE_H = Math.max(...Object.values(MAX_HOURS)) + 1;
+const PROFILE_MARGINAL_EFF = new Float32Array(PRACTICE_ORDER.length * EFF_TABLE_H);
+for (let p = 0; p < PRACTICE_ORDER.length; p++) {
+  const e = PROFILE_INV_DR[p];
+  for (let h = 0; h < EFF_TABLE_H; h++) {
+    PROFILE_MARGINAL_EFF[p * EFF_TABLE_H + h] = Math.pow(h + 1, e) - Math.pow(h, e);
+  }
+}
+const PROFILE_BENEFITS = new Float32Array(PRACTICE_ORDER.length * NUM_VALUES);
+for (let p = 0; p < PRACTICE_ORDER.length; p++) {
+  const benefits = PRACTICE_PROFILES[PRACTICE_ORDER[p]].benefits;
+  for (let d = 0; d < NUM_VALUES; d++) {
+    PROFILE_BENEFITS[p * NUM_VALUES + d] = benefits[VALUE_ORDER[d]] || 0;
+  }
+}
+
 // ── Seeded RNG for reproducibility ──────────────────────────────────────────
 function mulberry32(seed) {
   return function() {
@@ -71,6 +109,8 @@ function createAgent(id, rand) {
     awareOf:      new Set(),
     commStrength: 0.5 + rand() * 0.5,
     stepsSinceChange: 100,
+    dominantCache: null,    // invalidated whenever timeAllocation changes
+    freeTimeCache: null,    // ditto
   };
 }
 
@@ -85,10 +125,22 @@ function applyValueSettings(agent, valueSettings, rand) {
 }
 
 function getFreeTime(agent) {
-  return agent.timeBudget - Object.values(agent.timeAllocation).reduce((s, h) => s + h, 0);
+  // Same caching contract as getDominantPractice below: recomputed only
+  // after a reallocation resets the cache, so per-render reads don't walk
+  // the allocation object.
+  if (agent.freeTimeCache !== null) return agent.freeTimeCache;
+  let used = 0;
+  for (const h of Object.values(agent.timeAllocation)) used += h;
+  agent.freeTimeCache = agent.timeBudget - used;
+  return agent.freeTimeCache;
 }
 
 function getDominantPractice(agent, institutions) {
+  // Queried once per agent per render frame; the allocation only changes on
+  // reallocation, so cache the answer and let the mutating code paths reset
+  // dominantCache to null.
+  if (agent.dominantCache !== null) return agent.dominantCache;
+
   const totals = {};
   for (const [name, hours] of Object.entries(agent.timeAllocation)) {
     const inst = institutions[name];
@@ -96,8 +148,12 @@ function getDominantPractice(agent, institutions) {
       totals[inst.practiceType] = (totals[inst.practiceType] || 0) + hours;
     }
   }
-  if (!Object.keys(totals).length) return 'none';
-  return Object.entries(totals).sort((a, b) => b[1] - a[1])[0][0];
+  let dom = 'none';
+  if (Object.keys(totals).length) {
+    dom = Object.entries(totals).sort((a, b) => b[1] - a[1])[0][0];
+  }
+  agent.dominantCache = dom;
+  return dom;
 }
 
 // ── Institution ──────────────────────────────────────────────────────────────
@@ -105,6 +161,7 @@ function createInstitution(config, rand) {
   return {
     name:              config.name,
     practiceType:      config.type,
+    practiceId:        PRACTICE_IDS[config.type] ?? -1,
     size:              config.size,
     members:           new Set(),
     culture:           { ...config.culture },
@@ -115,68 +172,124 @@ function createInstitution(config, rand) {
 }
 
 // ── Utility calculations ─────────────────────────────────────────────────────
-function calcUtility(agent, instName, hours, institutions) {
-  if (hours <= 0) return 0;
-  const inst    = institutions[instName];
-  if (!inst) return 0;
-  const profile = PRACTICE_PROFILES[inst.practiceType];
-  if (!profile) return 0;
-
-  const eff = Math.pow(hours, 1 / profile.dr);
-  let u = 0;
-  for (const [dim, benefit] of Object.entries(profile.benefits)) {
-    u += benefit * (agent.values[dim] || 0) * eff;
-  }
-  if (inst.practiceType === 'work') {
-    u += hours * inst.moneyIncomePerHour * (agent.values.wealth || 0) * 0.01;
-  } else {
-    u -= hours * inst.moneyCostPerHour  * (agent.values.wealth || 0) * 0.01;
-  }
-  return u;
-}
+// Static per-institution data and scratch buffers for the allocator, built
+// once per step and shared across every agent's reallocation. Institutions
+// never change after init, so the only per-agent work left is filling the
+// candidate (c*) scratch columns from the agent's aware set.
+function buildAllocContext(institutions) {
+  const names = Object.keys(institutions);
+  const K = names.length;
+  const ctx = {
+    names,
+    index:  new Map(),
+    pids:   new Int32Array(K),
+    valid:  new Uint8Array(K),
+    maxHrs: new Float64Array(K),
+    income: new Float64Array(K),
+    cost:   new Float64Array(K),
+    isWork: new Uint8Array(K),
+    // candidate scratch, reused across agents
+    candIdx: new Int32Array(K),
+    coeffs:  new Float64Array(K),
+    cPids:   new Int32Array(K),
+    cMaxHrs: new Float64Array(K),
+    cMoney:  new Float64Array(K),
+    cIncome: new Float64Array(K),
+    cCost:   new Float64Array(K),
+    cIsWork: new Uint8Array(K),
+    hours:   new Float32Array(K),
+  };
 
-function marginalUtility(agent, instName, currentHours, institutions) {
-  return calcUtility(agent, instName, currentHours + 1, institutions)
-       - calcUtility(agent, instName, currentHours,     institutions);
+  for (let k = 0; k < K; k++) {
+    const inst = institutions[names[k]];
+    const pid  = inst.practiceId;
+    ctx.index.set(names[k], k);
+    ctx.pids[k]   = pid;
+    ctx.valid[k]  = pid >= 0 ? 1 : 0;
+    ctx.maxHrs[k] = pid >= 0 ? PROFILE_MAX_HRS[pid] : 50;
+    ctx.income[k] = inst.moneyIncomePerHour || 0;
+    ctx.cost[k]   = inst.moneyCostPerHour   || 0;
+    ctx.isWork[k] = pid === WORK_ID ? 1 : 0;
+  }
+  return ctx;
 }
 
-function optimizeAllocation(agent, institutions) {
-  const allocation = {};
-  for (const name of agent.awareOf) allocation[name] = 0;
-  let timeLeft = agent.timeBudget;
-
-  for (let iter = 0; iter < agent.timeBudget; iter++) {
+// The greedy loop runs up to timeBudget iterations per agent per
+// reallocation, so it is kept as a numeric kernel over pre-packed parallel
+// arrays: no dict lookups, Sets, or property chains inside the hot loop.
+// Marginal utility collapses to coeff * ((h+1)^e - h^e) + moneyPerHour
+// because the benefit weights are linear in effective hours.
+function greedyAllocate(ctx, K, moneyBudget, timeBudget) {
+  const { coeffs, cPids: pids, cMaxHrs: maxHrs, cMoney: moneyPerHour,
+          cIncome: income, cCost: cost, cIsWork: isWork, hours } = ctx;
+  hours.fill(0, 0, K);
+  let timeLeft = timeBudget;
+
+  // Money balance is maintained incrementally as hours are assigned, rather
+  // than re-summing all K allocations for every candidate on every
+  // iteration (which made the loop O(K^2 * T)).
+  let balance = moneyBudget;
+
+  for (let iter = 0; iter < timeBudget; iter++) {
     if (timeLeft <= 0) break;
 
-    let bestInst = null, bestMU = 0.005;
+    let best = -1, bestMU = 0.005;
 
-    for (const name of agent.awareOf) {
-      const inst = institutions[name];
-      if (!inst) continue;
-      const cur    = allocation[name] || 0;
-      const maxHrs = MAX_HOURS[inst.practiceType] || 50;
-      if (cur >= maxHrs) continue;
+    for (let k = 0; k < K; k++) {
+      const h = hours[k];
+      if (h >= maxHrs[k]) continue;
 
       // Affordability
-      if (inst.practiceType !== 'work') {
-        const income = Object.entries(allocation)
-          .reduce((s, [n, h]) => s + h * (institutions[n]?.moneyIncomePerHour || 0), 0);
-        const costs  = Object.entries(allocation)
-          .reduce((s, [n, h]) => s + h * (institutions[n]?.moneyCostPerHour  || 0), 0);
-        const bal    = agent.moneyBudget + income - costs;
-        if (bal - inst.moneyCostPerHour < 0) continue;
-      }
+      if (!isWork[k] && balance - cost[k] < 0) continue;
 
-      const mu = marginalUtility(agent, name, cur, institutions);
-      if (mu > bestMU) { bestMU = mu; bestInst = name; }
+      const mu = coeffs[k] * PROFILE_MARGINAL_EFF[pids[k] * EFF_TABLE_H + h]
+               + moneyPerHour[k];
+      if (mu > bestMU) { bestMU = mu; best = k; }
     }
 
-    if (!bestInst) break;
-    allocation[bestInst] = (allocation[bestInst] || 0) + 1;
+    if (best < 0) break;
+    hours[best] += 1;
+    balance += income[best] - cost[best];
     timeLeft--;
   }
 
-  return Object.fromEntries(Object.entries(allocation).filter(([, h]) => h >= 0.5));
+  return hours;
+}
+
+function optimizeAllocation(agent, institutions, ctx = buildAllocContext(institutions)) {
+  // Fill the candidate scratch columns from the agent's aware set.
+  const vvec = agent.valuesVec;
+  const wealth = vvec[WEALTH_IDX];
+  let m = 0;
+
+  for (const name of agent.awareOf) {
+    const k = ctx.index.get(name);
+    if (k === undefined || !ctx.valid[k]) continue;
+
+    const off = ctx.pids[k] * NUM_VALUES;
+    let c = 0;
+    for (let d = 0; d < NUM_VALUES; d++) c += PROFILE_BENEFITS[off + d] * vvec[d];
+
+    ctx.candIdx[m] = k;
+    ctx.coeffs[m]  = c;
+    ctx.cPids[m]   = ctx.pids[k];
+    ctx.cMaxHrs[m] = ctx.maxHrs[k];
+    ctx.cIncome[m] = ctx.income[k];
+    ctx.cCost[m]   = ctx.cost[k];
+    ctx.cIsWork[m] = ctx.isWork[k];
+    ctx.cMoney[m]  = ctx.isWork[k]
+      ?  ctx.income[k] * wealth * 0.01
+      : -ctx.cost[k]   * wealth * 0.01;
+    m++;
+  }
+
+  const hours = greedyAllocate(ctx, m, agent.moneyBudget, agent.timeBudget);
+
+  const allocation = {};
+  for (let j = 0; j < m; j++) {
+    if (hours[j] >= 0.5) allocation[ctx.names[ctx.candIdx[j]]] = hours[j];
+  }
+  return allocation;
 }
 
 // ── Network ──────────────────────────────────────────────────────────────────
@@ -184,13 +297,19 @@ function buildAdjacency(n, density, rand) {
   // Sparse adjacency as Map<id, Set<id>>
   const adj = new Map();
   for (let i = 0; i < n; i++) adj.set(i, new Set());
-
-  for (let i = 0; i < n; i++) {
-    for (let j = i + 1; j < n; j++) {
-      if (rand() < density) {
-        adj.get(i).add(j);
-        adj.get(j).add(i);
-      }
+  if (density <= 0) return adj;
+
+  // G(n, p) by skip sampling (Batagelj-Brandes): draw the gap to the next
+  // present edge from a geometric distribution and jump straight to it,
+  // expected O(E) work instead of one Bernoulli draw per pair.
+  const logq = Math.log(1 - density);
+  let v = 1, w = -1;
+  while (v < n) {
+    w += 1 + Math.floor(Math.log(1 - rand()) / logq);
+    while (w >= v && v < n) { w -= v; v++; }
+    if (v < n) {
+      adj.get(v).add(w);
+      adj.get(w).add(v);
     }
   }
   return adj;
@@ -198,28 +317,114 @@ function buildAdjacency(n, density, rand) {
 
 function addInstitutionalEdges(adjacency, institutions, agents) {
   for (const inst of Object.values(institutions)) {
+    // Snapshot members once and hoist the row lookup for `a` out of the
+    // inner loop — the clique loop is O(|M|^2) per institution, so the
+    // per-pair Map lookups are what dominate here.
     const members = [...inst.members];
     for (let i = 0; i < members.length; i++) {
+      const a = members[i];
+      const rowA = adjacency.get(a);
       for (let j = i + 1; j < members.length; j++) {
-        const a = members[i], b = members[j];
-        adjacency.get(a).add(b);
+        const b = members[j];
+        rowA.add(b);
         adjacency.get(b).add(a);
       }
     }
   }
 }
 
+// CSR snapshot of the adjacency Map: indptr[i]..indptr[i+1] indexes into a
+// flat Int32Array of neighbour ids. The Map-of-Sets stays the mutable source
+// of truth; the snapshot is what the per-step neighbour scans iterate, since
+// walking two typed arrays is far cheaper than Map.get + Set iteration per
+// agent per step.
+function buildAdjacencyCSR(adjacency, n) {
+  const indptr = new Int32Array(n + 1);
+  for (let i = 0; i < n; i++) {
+    indptr[i + 1] = indptr[i] + (adjacency.get(i)?.size || 0);
+  }
+  const indices = new Int32Array(indptr[n]);
+  let p = 0;
+  for (let i = 0; i < n; i++) {
+    const nbrs = adjacency.get(i);
+    if (nbrs) for (const j of nbrs) indices[p++] = j;
+  }
+  return { indptr, indices };
+}
+
 // ── Broadcast awareness ──────────────────────────────────────────────────────
-function broadcastAwareness(agents, institutions, radius) {
-  for (const agent of agents) {
-    for (const [name, inst] of Object.entries(institutions)) {
-      const dx = agent.position[0] - inst.position[0];
-      const dy = agent.position[1] - inst.position[1];
-      if (Math.sqrt(dx*dx + dy*dy) <= radius) {
-        agent.awareOf.add(name);
+// Positions packed as flat [x0,y0,x1,y1,...] typed arrays so the pairwise
+// distance test below runs over contiguous floats instead of per-object
+// property chains.
+function agentPositionsArray(agents) {
+  const arr = new Float64Array(agents.length * 2);
+  for (let i = 0; i < agents.length; i++) {
+    arr[2*i]   = agents[i].position[0];
+    arr[2*i+1] = agents[i].position[1];
+  }
+  return arr;
+}
+
+function institutionPositionsArray(institutions) {
+  const names = Object.keys(institutions);
+  const arr = new Float64Array(names.length * 2);
+  for (let k = 0; k < names.length; k++) {
+    const pos = institutions[names[k]].position;
+    arr[2*k]   = pos[0];
+    arr[2*k+1] = pos[1];
+  }
+  return { names, arr };
+}
+
+// Uniform grid over [0,1]² with cell size = query radius, so a radius query
+// only has to inspect the 3×3 block of cells around the query point. Agents
+// never move after creation, so the grid is built once per broadcast.
+function buildAgentGrid(agentPos, nAgents, cellSize) {
+  const size = Math.max(cellSize, 1e-6);
+  const dim  = Math.max(1, Math.ceil(1 / size));
+  const cells = new Map();
+  for (let i = 0; i < nAgents; i++) {
+    const cx = Math.min(dim - 1, Math.floor(agentPos[2*i]   / size));
+    const cy = Math.min(dim - 1, Math.floor(agentPos[2*i+1] / size));
+    const key = cx * dim + cy;
+    let bucket = cells.get(key);
+    if (!bucket) { bucket = []; cells.set(key, bucket); }
+    bucket.push(i);
+  }
+  return { cells, dim, size };
+}
+
+function queryAgentsInRadius(grid, agentPos, x, y, radius, out) {
+  const { cells, dim, size } = grid;
+  const cx = Math.min(dim - 1, Math.floor(x / size));
+  const cy = Math.min(dim - 1, Math.floor(y / size));
+  const r2 = radius * radius;
+  out.length = 0;
+
+  for (let gx = Math.max(0, cx - 1); gx <= Math.min(dim - 1, cx + 1); gx++) {
+    for (let gy = Math.max(0, cy - 1); gy <= Math.min(dim - 1, cy + 1); gy++) {
+      const bucket = cells.get(gx * dim + gy);
+      if (!bucket) continue;
+      for (const i of bucket) {
+        const dx = agentPos[2*i] - x;
+        const dy = agentPos[2*i+1] - y;
+        // compare squared distances — no sqrt per candidate
+        if (dx*dx + dy*dy <= r2) out.push(i);
       }
     }
   }
+  return out;
+}
+
+function broadcastAwareness(agents, institutions, radius, agentPos = agentPositionsArray(agents)) {
+  const { names: instNames, arr: instPos } = institutionPositionsArray(institutions);
+  const grid = buildAgentGrid(agentPos, agents.length, radius);
+  const hits = [];
+
+  for (let k = 0; k < instNames.length; k++) {
+    queryAgentsInRadius(grid, agentPos, instPos[2*k], instPos[2*k+1], radius, hits);
+    for (const i of hits) agents[i].awareOf.add(instNames[k]);
+  }
 }
 
 // ── Main model factory ───────────────────────────────────────────────────────
@@ -243,6 +448,24 @@ export function createModel(config) {
     return a;
   });
 
+  // Structure-of-arrays backing store: positions and values live in two
+  // contiguous Float64Arrays owned by the model, and each agent's .position
+  // and .valuesVec are subarray views into them. Agent objects keep their
+  // shape for the UI; the hot paths get flat, cache-friendly buffers. Both
+  // are fixed after init.
+  const positions    = new Float64Array(nAgents * 2);
+  const valuesMatrix = new Float32Array(nAgents * VALUE_ORDER.length);
+  for (let i = 0; i < nAgents; i++) {
+    const a = agents[i];
+    positions[2*i]   = a.position[0];
+    positions[2*i+1] = a.position[1];
+    a.position = positions.subarray(2*i, 2*i + 2);
+
+    const row = valuesMatrix.subarray(i * VALUE_ORDER.length, (i + 1) * VALUE_ORDER.length);
+    for (let d = 0; d < VALUE_ORDER.length; d++) row[d] = a.values[VALUE_ORDER[d]] || 0;
+    a.valuesVec = row;
+  }
+
   // Create institutions
   const institutions = {};
   for (const def of institutionDefs) {
@@ -250,16 +473,48 @@ export function createModel(config) {
     institutions[key] = createInstitution(def, rand);
   }
 
+  // Reverse index from institution name to practice index. Institutions are
+  // fixed after init, so the per-step bookkeeping never has to chase
+  // institutions[name].practiceType again.
+  const ptypes = PRACTICE_ORDER;
+  const instPractice = {};
+  for (const key of Object.keys(institutions)) {
+    instPractice[key] = institutions[key].practiceId;
+  }
+
   // Broadcast spatial awareness
-  broadcastAwareness(agents, institutions, awarenessRadius);
+  broadcastAwareness(agents, institutions, awarenessRadius, positions);
+
+  // Initial memberships. All culture fits are computed up front as one
+  // dense K x N pass over the packed culture and value matrices (the matrix
+  // product culture_mat . values^T, written out); the membership loop below
+  // then only reads fits and draws from the seeded RNG in the same order as
+  // before, so admissions stay reproducible per seed.
+  const instKeys   = Object.keys(institutions);
+  const cultureMat = new Float32Array(instKeys.length * NUM_VALUES);
+  for (let k = 0; k < instKeys.length; k++) {
+    const culture = institutions[instKeys[k]].culture;
+    for (let d = 0; d < NUM_VALUES; d++) {
+      cultureMat[k * NUM_VALUES + d] = culture[VALUE_ORDER[d]] || 0;
+    }
+  }
+  const fits = new Float32Array(instKeys.length * nAgents);
+  for (let k = 0; k < instKeys.length; k++) {
+    const off = k * NUM_VALUES;
+    for (let i = 0; i < nAgents; i++) {
+      const ioff = i * NUM_VALUES;
+      let f = 0;
+      for (let d = 0; d < NUM_VALUES; d++) f += cultureMat[off + d] * valuesMatrix[ioff + d];
+      fits[k * nAgents + i] = f;
+    }
+  }
+  const instIndex = new Map(instKeys.map((key, k) => [key, k]));
 
-  // Initial memberships
   for (const agent of agents) {
     for (const instName of agent.awareOf) {
       const inst = institutions[instName];
       if (!inst) continue;
-      const fit = Object.entries(inst.culture)
-        .reduce((s, [k, v]) => s + v * (agent.values[k] || 0), 0);
+      const fit = fits[instIndex.get(instName) * nAgents + agent.id];
       if (fit > 0 && rand() < 0.3 && inst.members.size < inst.size) {
         inst.members.add(agent.id);
         agent.institutions.add(instName);
@@ -276,66 +531,131 @@ export function createModel(config) {
   // Build network
   const adjacency = buildAdjacency(nAgents, networkDensity, rand);
   addInstitutionalEdges(adjacency, institutions, agents);
+  const adjacencyCSR = buildAdjacencyCSR(adjacency, nAgents);
+
+  // History: preallocated typed columns written by index (doubled on
+  // overflow in recordState), so per-step recording never boxes numbers
+  // into lists and charts can read a subarray view without copying.
+  const history = { len: 0, cap: 256 };
+  history.step = { buf: new Float32Array(history.cap) };
+  for (const p of Object.keys(PRACTICE_PROFILES)) {
+    history[`${p}_rate`]  = { buf: new Float32Array(history.cap) };
+    history[`${p}_hours`] = { buf: new Float32Array(history.cap) };
+  }
 
-  // History
-  const history = { step: [], ...Object.fromEntries(
-    Object.keys(PRACTICE_PROFILES).flatMap(p => [
-      [`${p}_rate`, []],
-      [`${p}_hours`, []],
-    ])
-  )};
-
-  const model = { agents, institutions, adjacency, history, step: 0,
-                  reallocFreq, awarenessRadius, rand };
+  const model = { agents, institutions, adjacency, adjacencyCSR, history, step: 0,
+                  reallocFreq, awarenessRadius, rand, positions, valuesMatrix,
+                  ptypes, instPractice,
+                  commOk: Uint8Array.from(agents, a => a.commStrength >= 0.2 ? 1 : 0),
+                  agentOrder: Int32Array.from({ length: nAgents }, (_, i) => i) };
 
   recordState(model);
   return model;
 }
 
+function growHistory(history) {
+  history.cap *= 2;
+  for (const k of Object.keys(history)) {
+    const col = history[k];
+    if (!col || col.buf === undefined) continue;
+    const next = new Float32Array(history.cap);
+    next.set(col.buf);
+    col.buf = next;
+  }
+}
+
+// Read-only view of one history column, trimmed to the recorded length.
+export function historyView(history, key) {
+  const col = history[key];
+  return col ? col.buf.subarray(0, history.len) : new Float32Array(0);
+}
+
 function recordState(model) {
   const { agents, institutions, history, step } = model;
-  history.step.push(step);
-
-  for (const ptype of Object.keys(PRACTICE_PROFILES)) {
-    let totalHours = 0, participants = 0;
-    for (const agent of agents) {
-      let agentHours = 0;
-      for (const [name, hrs] of Object.entries(agent.timeAllocation)) {
-        if (institutions[name]?.practiceType === ptype) agentHours += hrs;
-      }
-      totalHours   += agentHours;
-      if (agentHours > 0) participants++;
+  if (history.len === history.cap) growHistory(history);
+  const w = history.len++;
+  history.step.buf[w] = step;
+
+  // One pass over agents instead of one per practice type, using the
+  // name -> practice-index table built once at init.
+  const { ptypes, instPractice } = model;
+  const totalHours   = new Float64Array(ptypes.length);
+  const participants = new Int32Array(ptypes.length);
+  const agentHours   = new Float64Array(ptypes.length);
+
+  for (const agent of agents) {
+    agentHours.fill(0);
+    for (const [name, hrs] of Object.entries(agent.timeAllocation)) {
+      const pi = instPractice[name];
+      if (pi >= 0) agentHours[pi] += hrs;
+    }
+    for (let i = 0; i < ptypes.length; i++) {
+      totalHours[i] += agentHours[i];
+      if (agentHours[i] > 0) participants[i]++;
     }
-    history[`${ptype}_rate`].push(participants / agents.length);
-    history[`${ptype}_hours`].push(totalHours / agents.length);
+  }
+
+  for (let i = 0; i < ptypes.length; i++) {
+    history[`${ptypes[i]}_rate`].buf[w]  = participants[i] / agents.length;
+    history[`${ptypes[i]}_hours`].buf[w] = totalHours[i] / agents.length;
   }
 }
 
 // ── Step ─────────────────────────────────────────────────────────────────────
-export function stepModel(model) {
+export function stepModel(model, allocCtx = buildAllocContext(model.institutions)) {
   const { agents, institutions, adjacency, reallocFreq, awarenessRadius, rand } = model;
+  const { indptr, indices } = model.adjacencyCSR;
+  let edgesChanged = false;
+
+  // Shuffle the preallocated index array in place (Fisher-Yates). The old
+  // sort-comparator shuffle allocated a fresh array every step and is not
+  // even uniform.
+  const order = model.agentOrder;
+  for (let i = order.length - 1; i > 0; i--) {
+    const j = Math.floor(rand() * (i + 1));
+    const tmp = order[i]; order[i] = order[j]; order[j] = tmp;
+  }
 
-  // Shuffle agents
-  const order = agents.map((_, i) => i).sort(() => rand() - 0.5);
+  // Pass 1: learn about institutions from neighbours. This reads only the
+  // membership sets as they stood at the start of the step, so it is
+  // order-independent — each agent touches its own awareOf and nothing
+  // else, which is what would let this pass (and the per-agent greedy
+  // optimisation below) move onto workers.
+  // commOk is the precomputed (static) commStrength >= 0.2 test, so the
+  // scan only dereferences neighbours that actually communicate.
+  // awareOf is copy-on-write: the set is only replaced when the agent
+  // actually learns something new, so render-side holders of the old set
+  // never see it change and the common saturated case allocates nothing.
+  const commOk = model.commOk;
+  for (const agent of agents) {
+    let aware  = agent.awareOf;
+    let copied = false;
+    for (let p = indptr[agent.id]; p < indptr[agent.id + 1]; p++) {
+      const j = indices[p];
+      if (commOk[j]) {
+        for (const inst of agents[j].institutions) {
+          if (!aware.has(inst)) {
+            if (!copied) { aware = new Set(aware); copied = true; }
+            aware.add(inst);
+          }
+        }
+      }
+    }
+    if (copied) agent.awareOf = aware;
+  }
 
+  // Pass 2: reallocation, in shuffled order. Capacity contention (who gets
+  // the last slot of a full institution) stays sequential on purpose.
   for (const idx of order) {
     const agent = agents[idx];
     agent.stepsSinceChange++;
 
-    // Learn about institutions from neighbours
-    for (const nbrId of (adjacency.get(agent.id) || [])) {
-      const nbr = agents[nbrId];
-      if (nbr.commStrength >= 0.2) {
-        for (const inst of nbr.institutions) agent.awareOf.add(inst);
-      }
-    }
-
-    // Re-optimise
     if (agent.stepsSinceChange >= reallocFreq) {
-      const newAlloc = optimizeAllocation(agent, institutions);
+      const newAlloc = optimizeAllocation(agent, institutions, allocCtx);
 
-      // Update institution membership
-      const oldInsts = new Set(agent.institutions);
+      // Update institution membership. The old set is not mutated below, so
+      // diff against it directly instead of copying it first.
+      const oldInsts = agent.institutions;
       const newInsts = new Set(Object.keys(newAlloc));
 
       for (const name of oldInsts) {
@@ -346,18 +666,34 @@ export function stepModel(model) {
       for (const name of newInsts) {
         if (!oldInsts.has(name) && institutions[name] &&
             institutions[name].members.size < institutions[name].size) {
-          institutions[name].members.add(agent.id);
+          const inst = institutions[name];
+          // Wire the joiner to the current members right here instead of
+          // re-cliquing every institution at the end of the step. Leaving
+          // never removed edges in the old rebuild either, so joins are the
+          // only event that can change the edge set.
+          const row = adjacency.get(agent.id);
+          for (const other of inst.members) {
+            row.add(other);
+            adjacency.get(other).add(agent.id);
+          }
+          inst.members.add(agent.id);
+          edgesChanged = true;
         }
       }
 
       agent.timeAllocation    = newAlloc;
       agent.institutions      = newInsts;
       agent.stepsSinceChange  = 0;
+      agent.dominantCache     = null;
+      agent.freeTimeCache     = null;
     }
   }
 
-  // Rebuild institutional network edges
-  addInstitutionalEdges(adjacency, institutions, agents);
+  // Institutional edges are maintained incrementally above; just refresh
+  // the CSR snapshot when the edge set actually changed.
+  if (edgesChanged) {
+    model.adjacencyCSR = buildAdjacencyCSR(adjacency, agents.length);
+  }
 
   model.step++;
   recordState(model);
@@ -365,5 +701,148 @@ export function stepModel(model) {
   return model;
 }
 
+// Batched driver for multi-step runs: builds the allocation context once and
+// reuses it for every step, so +10/+50 runs don't repeat the per-step setup.
+export function stepModelN(model, n) {
+  const allocCtx = buildAllocContext(model.institutions);
+  for (let i = 0; i < n; i++) stepModel(model, allocCtx);
+  return model;
+}
+
+// Flat undirected edge list [a0,b0, a1,b1, ...] derived from the CSR
+// snapshot. Cached against the snapshot's identity, so renderers can call
+// this every frame and only pay for extraction on steps where edges were
+// actually added.
+export function getEdgeList(model) {
+  const csr = model.adjacencyCSR;
+  if (model.edgeList && model.edgeListCSR === csr) return model.edgeList;
+
+  const { indptr, indices } = csr;
+  const n = indptr.length - 1;
+  let count = 0;
+  for (let i = 0; i < n; i++) {
+    for (let p = indptr[i]; p < indptr[i + 1]; p++) {
+      if (indices[p] > i) count++;
+    }
+  }
+  const edges = new Int32Array(count * 2);
+  let q = 0;
+  for (let i = 0; i < n; i++) {
+    for (let p = indptr[i]; p < indptr[i + 1]; p++) {
+      if (indices[p] > i) { edges[q++] = i; edges[q++] = indices[p]; }
+    }
+  }
+  model.edgeList    = edges;
+  model.edgeListCSR = csr;
+  return edges;
+}
+
+// Node colour per agent, derived from the cached dominant practice and
+// keyed on the step, so every consumer of a render frame shares one pass
+// (and one array identity) instead of mapping the agents per component.
+export function getAgentColors(model) {
+  if (model.agentColors && model.agentColorsStep === model.step) return model.agentColors;
+  const { agents, institutions } = model;
+  const colors = new Array(agents.length);
+  for (let i = 0; i < agents.length; i++) {
+    colors[i] = PRACTICE_COLORS[getDominantPractice(agents[i], institutions)] || PRACTICE_COLORS.none;
+  }
+  model.agentColors     = colors;
+  model.agentColorsStep = model.step;
+  return colors;
+}
+
+// Summary statistics of the social network (density, average local
+// clustering, connectedness), computed from the CSR snapshot and cached
+// against its identity like getEdgeList — renders between edge changes
+// pay a field read, not three graph traversals.
+export function getNetworkStats(model) {
+  const csr = model.adjacencyCSR;
+  if (model.networkStats && model.networkStatsCSR === csr) return model.networkStats;
+
+  const { indptr, indices } = csr;
+  const n      = indptr.length - 1;
+  const nEdges = indices.length / 2;
+  const density = n > 1 ? (2 * nEdges) / (n * (n - 1)) : 0;
+
+  // Average local clustering: mark each node's neighbourhood in a scratch
+  // byte array, then count marked entries in every neighbour's row. Each
+  // neighbour-neighbour edge is seen twice, matching the k(k-1) divisor.
+  const mark = new Uint8Array(n);
+  let clustSum = 0;
+  for (let i = 0; i < n; i++) {
+    const start = indptr[i], end = indptr[i + 1];
+    const k = end - start;
+    if (k < 2) continue;
+    for (let p = start; p < end; p++) mark[indices[p]] = 1;
+    let links = 0;
+    for (let p = start; p < end; p++) {
+      const j = indices[p];
+      for (let q = indptr[j]; q < indptr[j + 1]; q++) {
+        if (mark[indices[q]]) links++;
+      }
+    }
+    for (let p = start; p < end; p++) mark[indices[p]] = 0;
+    clustSum += links / (k * (k - 1));
+  }
+  const clustering = n > 0 ? clustSum / n : 0;
+
+  // Connectedness: one BFS over the CSR arrays.
+  let connected = false;
+  if (n > 0) {
+    const seen  = new Uint8Array(n);
+    const queue = new Int32Array(n);
+    let head = 0, tail = 0;
+    seen[0] = 1;
+    queue[tail++] = 0;
+    while (head < tail) {
+      const v = queue[head++];
+      for (let p = indptr[v]; p < indptr[v + 1]; p++) {
+        const w = indices[p];
+        if (!seen[w]) { seen[w] = 1; queue[tail++] = w; }
+      }
+    }
+    connected = tail === n;
+  }
+
+  // Average shortest path length, only meaningful (and only defined here)
+  // when the graph is connected. The exact all-sources BFS is O(n·(n+E)),
+  // so past a size threshold it switches to BFS from a fixed spread of 20
+  // sources — deterministic, so repeated extractions of the same snapshot
+  // agree. Cached with the rest either way.
+  let avgPathLength = null;
+  if (connected && n > 1) {
+    const exact   = n * (n + 2 * nEdges) < 1e6;
+    const sources = exact ? n : 20;
+    const dist  = new Int32Array(n);
+    const queue = new Int32Array(n);
+    let total = 0;
+    for (let si = 0; si < sources; si++) {
+      const s = exact ? si : Math.floor(si * n / sources);
+      dist.fill(-1);
+      dist[s] = 0;
+      let head = 0, tail = 0;
+      queue[tail++] = s;
+      while (head < tail) {
+        const v = queue[head++];
+        for (let p = indptr[v]; p < indptr[v + 1]; p++) {
+          const w = indices[p];
+          if (dist[w] < 0) {
+            dist[w] = dist[v] + 1;
+            total += dist[w];
+            queue[tail++] = w;
+          }
+        }
+      }
+    }
+    avgPathLength = total / (sources * (n - 1));
+  }
+
+  const stats = { nEdges, density, clustering, connected, avgPathLength };
+  model.networkStats    = stats;
+  model.networkStatsCSR = csr;
+  return stats;
+}
+
 // ── Accessors ────────────────────────────────────────────────────────────────
 export { getFreeTime, getDominantPractice, PRACTICE_PROFILES };
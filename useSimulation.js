@@ -1,5 +1,5 @@
 import { useState, useCallback, useRef } from 'react';
-import { createModel, stepModel } from '../lib/simulation';
+import { createModel, stepModel, stepModelN } from '../lib/simulation';
 
 const DEFAULT_VALUES = {
   community: [0.5, 0.2],
@@ -53,11 +53,24 @@ export function useSimulation() {
     if (!modelRef.current) return;
     setIsRunning(true);
 
-    const tick = () => {
+    // Publish to React at most once per animation frame: at fast playback
+    // several steps can land between frames, and cloning the model for
+    // each one was the dominant cost — the step itself is cheap.
+    let pending = false;
+    const publish = () => {
+      pending = false;
       if (!modelRef.current) return;
-      stepModel(modelRef.current);
       setCurrentStep(modelRef.current.step);
       setModel(cloneModel(modelRef.current));
+    };
+
+    const tick = () => {
+      if (!modelRef.current) return;
+      stepModel(modelRef.current);
+      if (!pending) {
+        pending = true;
+        requestAnimationFrame(publish);
+      }
       animFrameRef.current = setTimeout(tick, speed);
     };
     animFrameRef.current = setTimeout(tick, speed);
@@ -70,9 +83,27 @@ export function useSimulation() {
 
   const runNSteps = useCallback((n) => {
     if (!modelRef.current) return;
-    for (let i = 0; i < n; i++) stepModel(modelRef.current);
-    setCurrentStep(modelRef.current.step);
-    setModel(cloneModel(modelRef.current));
+    // Run in chunks, yielding to the event loop between them, so a long
+    // run doesn't freeze the UI. Only the step counter updates while
+    // running; the model itself is published once at the end — per-chunk
+    // clones would just re-render views that are about to be stale.
+    const CHUNK = 10;
+    let remaining = n;
+    setIsRunning(true);
+    const runChunk = () => {
+      if (!modelRef.current) { setIsRunning(false); return; }
+      const k = Math.min(CHUNK, remaining);
+      stepModelN(modelRef.current, k);
+      remaining -= k;
+      setCurrentStep(modelRef.current.step);
+      if (remaining > 0) {
+        setTimeout(runChunk, 0);
+      } else {
+        setModel(cloneModel(modelRef.current));
+        setIsRunning(false);
+      }
+    };
+    runChunk();
   }, []);
 
   const reset = useCallback(() => {
@@ -116,20 +147,12 @@ export function useSimulation() {
   };
 }
 
-// Shallow clone for React — preserves Sets but triggers re-render
+// Top-level clone for React: a fresh object identity to trigger renders,
+// plus a history wrapper frozen at the current length. Everything else is
+// shared with the live model — stepModel replaces (not mutates) the
+// per-agent structures renders key on, so per-step deep copies buy
+// nothing. Institution member sets are still updated in place; the UI
+// reads their current counts by design.
 function cloneModel(m) {
-  return {
-    ...m,
-    agents:       m.agents.map(a => ({ ...a,
-      values:         { ...a.values },
-      timeAllocation: { ...a.timeAllocation },
-      institutions:   new Set(a.institutions),
-      awareOf:        new Set(a.awareOf),
-    })),
-    institutions: Object.fromEntries(
-      Object.entries(m.institutions).map(([k, v]) => [k, { ...v, members: new Set(v.members) }])
-    ),
-    history: { ...m.history },
-    adjacency: m.adjacency,   // keep reference (too large to copy every frame)
-  };
+  return { ...m, history: { ...m.history } };
 }